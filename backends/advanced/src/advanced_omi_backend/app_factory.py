@@ -30,7 +30,10 @@ from advanced_omi_backend.users import (
     register_client_to_user,
 )
 from advanced_omi_backend.client_manager import get_client_manager
-from advanced_omi_backend.services.memory import get_memory_service, shutdown_memory_service
+from advanced_omi_backend.services.memory import (
+    async_shutdown_memory_service,
+    get_memory_service,
+)
 from advanced_omi_backend.middleware.app_middleware import setup_middleware
 from advanced_omi_backend.routers.api_router import router as api_router
 from advanced_omi_backend.routers.modules.health_routes import router as health_router
@@ -163,7 +166,7 @@ async def lifespan(app: FastAPI):
         application_logger.info("Metrics collection stopped")
 
         # Shutdown memory service and speaker service
-        shutdown_memory_service()
+        await async_shutdown_memory_service()
         application_logger.info("Memory and speaker services shut down.")
 
         application_logger.info("Shutdown complete.")
@@ -116,7 +116,10 @@ async def delete_memory(memory_id: str, user: User):
         # For non-admin users, verify memory ownership before deletion
         if not user.is_superuser:
             # Check if memory belongs to current user
-            user_memories = await memory_service.get_all_memories(user.user_id, 1000)
+            # Only IDs are needed here, so skip fetching memory metadata
+            user_memories = await memory_service.get_all_memories(
+                user.user_id, 1000, include_metadata=False
+            )
 
             # MemoryEntry is a dataclass, access id attribute directly
             memory_ids = [str(mem.id) for mem in user_memories]
@@ -6,6 +6,7 @@ OpenAI, Ollama, and other OpenAI-compatible APIs.
 """
 
 import asyncio
+import concurrent.futures
 import logging
 import os
 from abc import ABC, abstractmethod
@@ -18,6 +19,16 @@ from advanced_omi_backend.model_registry import get_models_registry
 
 logger = logging.getLogger(__name__)
 
+# Dedicated thread pool for blocking LLM requests. OpenAI-compatible servers
+# (vLLM, Ollama, OpenAI) batch concurrent requests on their side, so keep enough
+# requests in flight for that to happen instead of queueing them behind other
+# work on the loop's default executor.
+LLM_MAX_CONCURRENCY = 16
+_LLM_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=LLM_MAX_CONCURRENCY,
+    thread_name_prefix="llm",
+)
+
 
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
@@ -95,20 +106,26 @@ class OpenAILLMClient(LLMClient):
         """Generate text completion using OpenAI-compatible API."""
         try:
             model_name = model or self.model
-            temp = temperature or self.temperature
-            
+            # Explicit None check so temperature=0 isn't replaced by the default
+            temp = temperature if temperature is not None else self.temperature
+
             # Build completion parameters
             params = {
                 "model": model_name,
                 "messages": [{"role": "user", "content": prompt}],
             }
-            
+
             # Skip temperature for gpt-4o-mini as it only supports default (1)
             if not (model_name and "gpt-4o-mini" in model_name):
                 params["temperature"] = temp
-            
+
             response = self.client.chat.completions.create(**params)
-            return response.choices[0].message.content.strip()
+            choice = response.choices[0]
+            if choice.finish_reason == "length":
+                self.logger.warning(
+                    f"Completion truncated by the server's token limit (model: {model_name})"
+                )
+            return choice.message.content.strip()
         except Exception as e:
             self.logger.error(f"Error generating completion: {e}")
             raise
@@ -199,7 +216,9 @@ async def async_generate(
     """Async wrapper for LLM text generation."""
     client = get_llm_client()
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, client.generate, prompt, model, temperature)
+    return await loop.run_in_executor(
+        _LLM_EXECUTOR, client.generate, prompt, model, temperature
+    )
 
 
 async def async_health_check() -> Dict:
@@ -9,6 +9,7 @@ This module defines the core abstractions and interfaces for:
 All concrete implementations should inherit from these base classes.
 """
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -22,12 +23,13 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryEntry:
     """Represents a memory entry with content, metadata, and embeddings.
     
     This is the core data structure used throughout the memory service
-    for storing and retrieving user memories.
+    for storing and retrieving user memories. Slotted, since providers
+    build thousands of these for large listings.
     
     Attributes:
         id: Unique identifier for the memory
@@ -135,13 +137,16 @@ class MemoryServiceBase(ABC):
     async def get_all_memories(
         self, 
         user_id: str, 
-        limit: int = 100
+        limit: int = 100,
+        include_metadata: bool = True
     ) -> List[MemoryEntry]:
         """Get all memories for a specific user.
         
         Args:
             user_id: User identifier
             limit: Maximum number of memories to return
+            include_metadata: When False, callers only need id and content;
+                providers may skip fetching metadata (and embeddings)
             
         Returns:
             List of MemoryEntry objects for the user
@@ -246,12 +251,22 @@ class MemoryServiceBase(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Asynchronously shutdown the memory service and release resources.
+
+        Default implementation delegates to shutdown(). Subclasses holding
+        async resources (HTTP clients, sockets) should override this so the
+        resources are released deterministically from async contexts.
+        """
+        self.shutdown()
+
     def __init__(self):
         """Initialize base memory service state.
         
         Subclasses should call super().__init__() in their constructors.
         """
         self._initialized = False
+        self._init_lock = asyncio.Lock()
     
     async def _ensure_initialized(self) -> None:
         """Ensure the memory service is initialized before use.
@@ -263,9 +278,15 @@ class MemoryServiceBase(ABC):
         
         This should be called at the start of any method that requires
         the service to be initialized (e.g., add_memory, search_memories).
+
+        Concurrent first callers are serialized on a lock so initialize()
+        runs once instead of once per racing coroutine.
         """
-        if not self._initialized:
-            await self.initialize()
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if not self._initialized:
+                await self.initialize()
 
 
 class LLMProviderBase(ABC):
@@ -251,7 +251,9 @@ class MemoryService(MemoryServiceBase):
             memory_logger.error(f"Search memories failed: {e}")
             return []
 
-    async def get_all_memories(self, user_id: str, limit: int = 100) -> List[MemoryEntry]:
+    async def get_all_memories(
+        self, user_id: str, limit: int = 100, include_metadata: bool = True
+    ) -> List[MemoryEntry]:
         """Get all memories for a specific user.
         
         Retrieves all stored memories for the given user without
@@ -260,6 +262,8 @@ class MemoryService(MemoryServiceBase):
         Args:
             user_id: User identifier
             limit: Maximum number of memories to return
+            include_metadata: Accepted for interface compatibility; entries
+                always include metadata
             
         Returns:
             List of MemoryEntry objects for the user
@@ -7,12 +7,16 @@ that uses Mycelia as the backend for all memory operations.
 import asyncio
 import json
 import logging
+import random
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
-from advanced_omi_backend.auth import generate_jwt_for_user
+from advanced_omi_backend.auth import JWT_LIFETIME_SECONDS, generate_jwt_for_user
 from advanced_omi_backend.users import User
 
 from ..base import MemoryEntry, MemoryServiceBase
@@ -27,6 +31,45 @@ from advanced_omi_backend.model_registry import get_models_registry
 
 memory_logger = logging.getLogger("memory_service")
 
+# Memory object names are "<prefix><first PREVIEW_LENGTH chars of the fact>..."
+PREVIEW_LENGTH = 50
+PREVIEW_ELLIPSIS = "..."
+MEMORY_NAME_PREFIX = "Memory: "
+
+MYCELIA_OBJECTS_PATH = "/api/resource/tech.mycelia.objects"
+MYCELIA_MONGO_PATH = "/api/resource/tech.mycelia.mongo"
+
+# Refresh cached JWTs this many seconds before they expire
+JWT_REFRESH_MARGIN_SECONDS = 60
+JWT_CACHE_TTL_SECONDS = max(JWT_LIFETIME_SECONDS - JWT_REFRESH_MARGIN_SECONDS, 1)
+JWT_CACHE_MAXSIZE = 1024
+
+# Maximum number of in-flight per-object deletes when bulk delete is unavailable
+DELETE_CONCURRENCY = 16
+# Number of memory IDs fetched per page when deleting all of a user's memories
+DELETE_PAGE_SIZE = 500
+# Maximum number of facts processed concurrently in add_memory
+ADD_CONCURRENCY = 8
+
+# Retry transient Mycelia failures with jittered exponential backoff
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 0.05
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+# Non-idempotent actions (create) are only retried when the server can't have
+# processed the request: it was never sent, or the server refused it with 503
+NON_IDEMPOTENT_ACTIONS = frozenset({"create"})
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+UNPROCESSED_STATUS_CODES = frozenset({503})
+
+# Circuit breaker: after too many failed calls in a window, fail fast for a while
+BREAKER_FAILURE_THRESHOLD = 20
+BREAKER_WINDOW_SECONDS = 10
+BREAKER_OPEN_SECONDS = 5
+
+
+class MyceliaCircuitOpenError(RuntimeError):
+    """Raised when a Mycelia call is rejected because the circuit breaker is open."""
+
 
 def strip_markdown_json(content: str) -> str:
     """Strip markdown code block wrapper from JSON content.
@@ -73,6 +116,27 @@ class MyceliaMemoryService(MemoryServiceBase):
         self.api_url = self.mycelia_config.get("api_url", "http://localhost:8080").rstrip("/")
         self.timeout = self.mycelia_config.get("timeout", 30)
         self._client: Optional[httpx.AsyncClient] = None
+        # Circuit breaker state shared by all Mycelia calls
+        self._breaker_failures = 0
+        self._breaker_window_start = 0.0
+        self._breaker_opened_at = 0.0
+        self._breaker_probing = False
+        # Holds the close task scheduled by shutdown() so it isn't garbage collected
+        self._close_task: Optional[asyncio.Task] = None
+
+        # Signed JWTs keyed by "user_id:email", expiring shortly before the token does
+        self._jwt_cache: TTLCache = TTLCache(maxsize=JWT_CACHE_MAXSIZE, ttl=JWT_CACHE_TTL_SECONDS)
+        # Pre-built Authorization headers for cached tokens, keyed by token
+        self._auth_headers: TTLCache = TTLCache(
+            maxsize=JWT_CACHE_MAXSIZE, ttl=JWT_CACHE_TTL_SECONDS
+        )
+        # user_id -> email, avoids a User.get() roundtrip per call
+        self._email_cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+        # user_id -> memory count, for frequently polled dashboard counts. Memories
+        # are ingested by the RQ worker process, so counts served by the API process
+        # can be up to the TTL (30s) stale; local invalidation only covers writes made
+        # in this process (e.g. deletes from the API).
+        self._count_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
 
         # Store LLM config for temporal extraction
         self.llm_config = config.llm_config or {}
@@ -83,9 +147,16 @@ class MyceliaMemoryService(MemoryServiceBase):
         """Initialize Mycelia client and verify connection."""
         try:
             # Initialize HTTP client
+            # HTTP/2 is only negotiated via TLS ALPN, so it applies to https:// Mycelia
+            # URLs (concurrent calls multiplex over a few connections); plain http://
+            # deployments stay on HTTP/1.1 and rely on the keep-alive pool below.
             self._client = httpx.AsyncClient(
                 base_url=self.api_url,
                 timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=32, max_keepalive_connections=16, keepalive_expiry=60
+                ),
                 headers={"Content-Type": "application/json"},
             )
 
@@ -107,6 +178,9 @@ class MyceliaMemoryService(MemoryServiceBase):
     async def _get_user_jwt(self, user_id: str, user_email: Optional[str] = None) -> str:
         """Get JWT token for a user (with optional user lookup).
 
+        Signed tokens are cached until shortly before they expire, so repeated
+        calls for the same user don't re-sign or hit MongoDB for the email.
+
         Args:
             user_id: User ID
             user_email: Optional user email (will lookup if not provided)
@@ -119,25 +193,54 @@ class MyceliaMemoryService(MemoryServiceBase):
         """
         # If email not provided, lookup user
         if not user_email:
-            user = await User.get(user_id)
-            if not user:
-                raise ValueError(f"User {user_id} not found")
-            user_email = user.email
-
-        return generate_jwt_for_user(user_id, user_email)
+            user_email = self._email_cache.get(user_id)
+            if not user_email:
+                user = await User.get(user_id)
+                if not user:
+                    raise ValueError(f"User {user_id} not found")
+                user_email = user.email
+                self._email_cache[user_id] = user_email
+
+        cache_key = f"{user_id}:{user_email or ''}"
+        token = self._jwt_cache.get(cache_key)
+        if token:
+            return token
+
+        # Signing is synchronous, so there's no await between the lookup and the
+        # insert and concurrent callers can't race to sign the same token
+        token = generate_jwt_for_user(user_id, user_email)
+        self._jwt_cache[cache_key] = token
+        self._auth_headers[token] = {"Authorization": f"Bearer {token}"}
+        return token
+
+    def _invalidate_jwt(self, user_id: str) -> None:
+        """Drop cached JWTs (and email) for a user so the next call re-signs."""
+        prefix = f"{user_id}:"
+        for key in [k for k in self._jwt_cache if k.startswith(prefix)]:
+            token = self._jwt_cache.pop(key, None)
+            if token:
+                self._auth_headers.pop(token, None)
+        self._email_cache.pop(user_id, None)
+
+    def _get_auth_headers(self, jwt_token: str) -> Dict[str, str]:
+        """Return the Authorization header for a token, reusing the cached dict."""
+        headers = self._auth_headers.get(jwt_token)
+        if headers is None:
+            headers = {"Authorization": f"Bearer {jwt_token}"}
+        return headers
 
     @staticmethod
     def _extract_bson_id(raw_id: Any) -> str:
         """Extract ID from Mycelia BSON format {"$oid": "..."} or plain string."""
-        if isinstance(raw_id, dict) and "$oid" in raw_id:
-            return raw_id["$oid"]
-        return str(raw_id)
+        if type(raw_id) is dict:
+            return raw_id.get("$oid") or str(raw_id)
+        return raw_id if type(raw_id) is str else str(raw_id)
 
     @staticmethod
     def _extract_bson_date(date_obj: Any) -> Any:
         """Extract date from Mycelia BSON format {"$date": "..."} or plain value."""
-        if isinstance(date_obj, dict) and "$date" in date_obj:
-            return date_obj["$date"]
+        if type(date_obj) is dict:
+            return date_obj.get("$date", date_obj)
         return date_obj
 
     def _mycelia_object_to_memory_entry(self, obj: Dict, user_id: str) -> MemoryEntry:
@@ -150,54 +253,192 @@ class MyceliaMemoryService(MemoryServiceBase):
         Returns:
             MemoryEntry object with full Mycelia metadata including temporal and semantic fields
         """
-        memory_id = self._extract_bson_id(obj.get("_id", ""))
-        memory_content = obj.get("details", "")
+        get = obj.get
+        extract_date = self._extract_bson_date
+        created_at = extract_date(get("createdAt"))
 
         # Build metadata with all Mycelia fields
         metadata = {
             "user_id": user_id,
-            "name": obj.get("name", ""),
-            "aliases": obj.get("aliases", []),
-            "created_at": self._extract_bson_date(obj.get("createdAt")),
-            "updated_at": self._extract_bson_date(obj.get("updatedAt")),
+            "name": get("name", ""),
+            "aliases": get("aliases", []),
+            "created_at": created_at,
+            "updated_at": extract_date(get("updatedAt")),
             # Semantic flags
-            "isPerson": obj.get("isPerson", False),
-            "isEvent": obj.get("isEvent", False),
-            "isPromise": obj.get("isPromise", False),
-            "isRelationship": obj.get("isRelationship", False),
+            "isPerson": get("isPerson", False),
+            "isEvent": get("isEvent", False),
+            "isPromise": get("isPromise", False),
+            "isRelationship": get("isRelationship", False),
         }
 
         # Add icon if present
-        if "icon" in obj and obj["icon"]:
-            metadata["icon"] = obj["icon"]
+        icon = get("icon")
+        if icon:
+            metadata["icon"] = icon
 
         # Add temporal information if present
-        if "timeRanges" in obj and obj["timeRanges"]:
+        time_ranges = get("timeRanges")
+        if time_ranges:
             # Convert BSON dates in timeRanges to ISO strings for JSON serialization
-            time_ranges = []
-            for tr in obj["timeRanges"]:
+            converted_ranges = []
+            for tr in time_ranges:
                 time_range = {
-                    "start": self._extract_bson_date(tr.get("start")),
-                    "end": self._extract_bson_date(tr.get("end")),
+                    "start": extract_date(tr.get("start")),
+                    "end": extract_date(tr.get("end")),
                 }
                 if "name" in tr:
                     time_range["name"] = tr["name"]
-                time_ranges.append(time_range)
-            metadata["timeRanges"] = time_ranges
+                converted_ranges.append(time_range)
+            metadata["timeRanges"] = converted_ranges
 
         return MemoryEntry(
-            id=memory_id,
-            content=memory_content,
+            id=self._extract_bson_id(get("_id", "")),
+            content=get("details", ""),
             metadata=metadata,
-            created_at=self._extract_bson_date(obj.get("createdAt")),
+            created_at=created_at,
         )
 
-    async def _call_resource(self, action: str, jwt_token: str, **params) -> Dict[str, Any]:
+    def _mycelia_object_to_light_entry(self, obj: Dict, user_id: str) -> MemoryEntry:
+        """Convert Mycelia object to MemoryEntry without building full metadata.
+
+        Args:
+            obj: Mycelia object from API (may be projected to _id/details/createdAt)
+            user_id: User ID for metadata
+
+        Returns:
+            MemoryEntry with id, content, created_at and only user_id in metadata
+        """
+        get = obj.get
+        return MemoryEntry(
+            id=self._extract_bson_id(get("_id", "")),
+            content=get("details", ""),
+            metadata={"user_id": user_id},
+            created_at=self._extract_bson_date(get("createdAt")),
+        )
+
+    def _record_call_failure(self, probe: bool = False) -> None:
+        """Count a failed Mycelia call and open the breaker past the threshold.
+
+        Args:
+            probe: True if the call was the half-open probe; a failed probe
+                reopens the breaker immediately
+        """
+        now = time.monotonic()
+        if probe:
+            memory_logger.warning(
+                f"Mycelia circuit breaker probe failed, reopening for {BREAKER_OPEN_SECONDS}s"
+            )
+            self._breaker_opened_at = now
+            return
+
+        if now - self._breaker_window_start > BREAKER_WINDOW_SECONDS:
+            self._breaker_window_start = now
+            self._breaker_failures = 0
+        self._breaker_failures += 1
+        if self._breaker_failures > BREAKER_FAILURE_THRESHOLD:
+            if not self._breaker_opened_at:
+                memory_logger.warning(
+                    f"Mycelia circuit breaker opened for {BREAKER_OPEN_SECONDS}s after "
+                    f"{self._breaker_failures} failures"
+                )
+            self._breaker_opened_at = now
+
+    def _record_call_success(self) -> None:
+        """Reset failure tracking and close the breaker after a successful call."""
+        if self._breaker_opened_at:
+            memory_logger.info("Mycelia circuit breaker closed")
+            self._breaker_opened_at = 0.0
+        self._breaker_failures = 0
+
+    async def _post(
+        self, path: str, body: bytes, jwt_token: str, idempotent: bool = True
+    ) -> httpx.Response:
+        """POST to Mycelia, retrying transient failures behind a circuit breaker.
+
+        Idempotent requests are retried on transport errors and 502/503/504
+        responses with jittered exponential backoff. Non-idempotent requests are
+        retried only when the request was never sent (connect/pool errors) or
+        refused with 503, so a request the server already committed is never
+        replayed. Other responses are returned as-is for the caller to check.
+
+        Once the breaker is open, calls fail fast for BREAKER_OPEN_SECONDS; then a
+        single probe call (no retries) is let through, and the breaker closes only
+        if it succeeds.
+
+        Args:
+            path: Resource path to POST to
+            body: Pre-serialized JSON request body
+            jwt_token: User's JWT token from Chronicle
+            idempotent: Whether the request may safely be sent more than once
+
+        Returns:
+            The final httpx response
+
+        Raises:
+            RuntimeError: If the client is not initialized
+            MyceliaCircuitOpenError: If the circuit breaker is open
+            httpx.TransportError: If the request failed at the transport level
+        """
+        if not self._client:
+            raise RuntimeError("Mycelia client not initialized")
+
+        probe = False
+        if self._breaker_opened_at:
+            if (
+                self._breaker_probing
+                or time.monotonic() - self._breaker_opened_at < BREAKER_OPEN_SECONDS
+            ):
+                raise MyceliaCircuitOpenError("Mycelia circuit breaker is open")
+            # Half-open: let this call alone through to probe the backend
+            self._breaker_probing = True
+            probe = True
+
+        if idempotent:
+            retry_errors, retry_statuses = httpx.TransportError, RETRYABLE_STATUS_CODES
+        else:
+            retry_errors, retry_statuses = UNSENT_REQUEST_ERRORS, UNPROCESSED_STATUS_CODES
+        attempts = 1 if probe else RETRY_ATTEMPTS
+
+        headers = self._get_auth_headers(jwt_token)
+        try:
+            attempt = 0
+            while True:
+                last_attempt = attempt + 1 >= attempts
+                try:
+                    response = await self._client.post(path, content=body, headers=headers)
+                except retry_errors:
+                    if last_attempt:
+                        raise
+                else:
+                    if last_attempt or response.status_code not in retry_statuses:
+                        break
+                await asyncio.sleep(random.uniform(0, RETRY_BASE_DELAY_SECONDS * 2**attempt))
+                attempt += 1
+        except httpx.TransportError:
+            self._record_call_failure(probe)
+            raise
+        finally:
+            if probe:
+                self._breaker_probing = False
+
+        # Any 5xx counts against the breaker, not only the retried ones; otherwise a
+        # backend answering 500 would keep resetting the failure count
+        if response.is_server_error:
+            self._record_call_failure(probe)
+        else:
+            self._record_call_success()
+        return response
+
+    async def _call_resource(
+        self, action: str, jwt_token: str, user_id: Optional[str] = None, **params
+    ) -> Dict[str, Any]:
         """Call Mycelia objects resource with JWT authentication.
 
         Args:
             action: Action to perform (create, list, get, delete, etc.)
             jwt_token: User's JWT token from Chronicle
+            user_id: Optional user ID; when given, a 401 drops the cached JWT
+                and the call is retried once with a freshly signed token
             **params: Additional parameters for the action
 
         Returns:
@@ -210,19 +451,28 @@ class MyceliaMemoryService(MemoryServiceBase):
             raise RuntimeError("Mycelia client not initialized")
 
         try:
-            response = await self._client.post(
-                "/api/resource/tech.mycelia.objects",
-                json={"action": action, **params},
-                headers={"Authorization": f"Bearer {jwt_token}"},
-            )
+            # Serialize once with orjson; the client already sends the JSON Content-Type
+            body = orjson.dumps({"action": action, **params})
+            idempotent = action not in NON_IDEMPOTENT_ACTIONS
+            response = await self._post(MYCELIA_OBJECTS_PATH, body, jwt_token, idempotent)
+            if response.status_code == 401 and user_id:
+                # Rejected before processing, so resending is safe even for creates
+                memory_logger.warning(f"Mycelia rejected JWT for user {user_id}, re-signing")
+                self._invalidate_jwt(user_id)
+                jwt_token = await self._get_user_jwt(user_id)
+                response = await self._post(MYCELIA_OBJECTS_PATH, body, jwt_token, idempotent)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as e:
             memory_logger.exception(
                 f"Mycelia API error: {e.response.status_code} - {e.response.text}"
             )
             raise RuntimeError(f"Mycelia API error: {e.response.status_code}") from e
+        except MyceliaCircuitOpenError as e:
+            # Expected while Mycelia is down; a traceback per fast-failed call is noise
+            memory_logger.warning(f"Skipped Mycelia {action} call: {e}")
+            raise
         except Exception as e:
             memory_logger.exception(f"Failed to call Mycelia resource: {e}")
             raise RuntimeError(f"Mycelia API call failed: {e}") from e
@@ -365,6 +615,95 @@ class MyceliaMemoryService(MemoryServiceBase):
             # Don't fail the entire memory creation if temporal extraction fails
             return None
 
+    async def _create_memory_object(
+        self, fact: str, source_id: str, client_id: str, jwt_token: str, user_id: str
+    ) -> Optional[str]:
+        """Extract temporal data for a fact and store it as a Mycelia object.
+
+        Args:
+            fact: Memory fact text
+            source_id: Source identifier stored as an alias
+            client_id: Client identifier stored as an alias
+            jwt_token: User's JWT token from Chronicle
+            user_id: User identifier
+
+        Returns:
+            ID of the created object, or None if Mycelia didn't return one
+        """
+        fact_preview = (
+            fact[:PREVIEW_LENGTH] + PREVIEW_ELLIPSIS if len(fact) > PREVIEW_LENGTH else fact
+        )
+
+        # Extract temporal and entity information
+        temporal_entity = await self._extract_temporal_entity_via_llm(fact)
+
+        # Build object data with temporal/entity information if available
+        if temporal_entity:
+            # Convert timeRanges from Pydantic models to dict format for Mycelia API
+            time_ranges = []
+            for tr in temporal_entity.timeRanges:
+                time_range_dict = {
+                    "start": tr.start.isoformat() if isinstance(tr.start, datetime) else tr.start,
+                    "end": tr.end.isoformat() if isinstance(tr.end, datetime) else tr.end,
+                }
+                if tr.name:
+                    time_range_dict["name"] = tr.name
+                time_ranges.append(time_range_dict)
+
+            # Use emoji in name if available, otherwise use default
+            emoji = temporal_entity.emoji
+            name_prefix = emoji + " " if emoji else MEMORY_NAME_PREFIX
+
+            object_data = {
+                "name": name_prefix + fact_preview,
+                "details": fact,
+                "aliases": [source_id, client_id]
+                + temporal_entity.entities,  # Include extracted entities
+                "isPerson": temporal_entity.isPerson,
+                "isPromise": temporal_entity.isPromise,
+                "isEvent": temporal_entity.isEvent,
+                "isRelationship": temporal_entity.isRelationship,
+                # Note: userId is auto-injected by Mycelia from JWT
+            }
+
+            # Add timeRanges if temporal information was extracted
+            if time_ranges:
+                object_data["timeRanges"] = time_ranges
+
+            # Add emoji icon if available
+            if temporal_entity.emoji:
+                object_data["icon"] = {"text": temporal_entity.emoji}
+
+            memory_logger.info(
+                f"📅 Temporal extraction: isEvent={temporal_entity.isEvent}, timeRanges={len(time_ranges)}, entities={len(temporal_entity.entities)}"
+            )
+        else:
+            # Fallback to basic object without temporal data
+            object_data = {
+                "name": MEMORY_NAME_PREFIX + fact_preview,
+                "details": fact,
+                "aliases": [source_id, client_id],
+                "isPerson": False,
+                "isPromise": False,
+                "isEvent": False,
+                "isRelationship": False,
+            }
+            memory_logger.warning(f"⚠️  No temporal data extracted for fact: {fact_preview}")
+
+        result = await self._call_resource(
+            action="create", jwt_token=jwt_token, user_id=user_id, object=object_data
+        )
+
+        # insertedId may come back as {"$oid": "..."} depending on Mycelia's serializer
+        raw_id = result.get("insertedId")
+        memory_id = self._extract_bson_id(raw_id) if raw_id else None
+        if memory_id:
+            memory_logger.info(f"✅ Created Mycelia memory object: {memory_id} - {fact_preview}")
+            return memory_id
+
+        memory_logger.error(f"Failed to create memory fact: {fact}")
+        return None
+
     async def add_memory(
         self,
         transcript: str,
@@ -404,82 +743,31 @@ class MyceliaMemoryService(MemoryServiceBase):
                 memory_logger.warning("No memories extracted from transcript")
                 return (False, [])
 
-            # Create Mycelia objects for each extracted fact
-            memory_ids = []
-            for fact in extracted_facts:
-                fact_preview = fact[:50] + ("..." if len(fact) > 50 else "")
-
-                # Extract temporal and entity information
-                temporal_entity = await self._extract_temporal_entity_via_llm(fact)
-
-                # Build object data with temporal/entity information if available
-                if temporal_entity:
-                    # Convert timeRanges from Pydantic models to dict format for Mycelia API
-                    time_ranges = []
-                    for tr in temporal_entity.timeRanges:
-                        time_range_dict = {
-                            "start": (
-                                tr.start.isoformat() if isinstance(tr.start, datetime) else tr.start
-                            ),
-                            "end": tr.end.isoformat() if isinstance(tr.end, datetime) else tr.end,
-                        }
-                        if tr.name:
-                            time_range_dict["name"] = tr.name
-                        time_ranges.append(time_range_dict)
-
-                    # Use emoji in name if available, otherwise use default
-                    name_prefix = temporal_entity.emoji if temporal_entity.emoji else "Memory:"
-
-                    object_data = {
-                        "name": f"{name_prefix} {fact_preview}",
-                        "details": fact,
-                        "aliases": [source_id, client_id]
-                        + temporal_entity.entities,  # Include extracted entities
-                        "isPerson": temporal_entity.isPerson,
-                        "isPromise": temporal_entity.isPromise,
-                        "isEvent": temporal_entity.isEvent,
-                        "isRelationship": temporal_entity.isRelationship,
-                        # Note: userId is auto-injected by Mycelia from JWT
-                    }
-
-                    # Add timeRanges if temporal information was extracted
-                    if time_ranges:
-                        object_data["timeRanges"] = time_ranges
-
-                    # Add emoji icon if available
-                    if temporal_entity.emoji:
-                        object_data["icon"] = {"text": temporal_entity.emoji}
+            # Facts are independent, so overlap their temporal extraction and
+            # create calls instead of paying each round trip sequentially
+            semaphore = asyncio.Semaphore(ADD_CONCURRENCY)
 
-                    memory_logger.info(
-                        f"📅 Temporal extraction: isEvent={temporal_entity.isEvent}, timeRanges={len(time_ranges)}, entities={len(temporal_entity.entities)}"
+            async def _create_fact(fact: str) -> Optional[str]:
+                async with semaphore:
+                    return await self._create_memory_object(
+                        fact, source_id, client_id, jwt_token, user_id
                     )
-                else:
-                    # Fallback to basic object without temporal data
-                    object_data = {
-                        "name": f"Memory: {fact_preview}",
-                        "details": fact,
-                        "aliases": [source_id, client_id],
-                        "isPerson": False,
-                        "isPromise": False,
-                        "isEvent": False,
-                        "isRelationship": False,
-                    }
-                    memory_logger.warning(f"⚠️  No temporal data extracted for fact: {fact_preview}")
-
-                result = await self._call_resource(
-                    action="create", jwt_token=jwt_token, object=object_data
-                )
 
-                memory_id = result.get("insertedId")
-                if memory_id:
-                    memory_logger.info(
-                        f"✅ Created Mycelia memory object: {memory_id} - {fact_preview}"
-                    )
-                    memory_ids.append(memory_id)
-                else:
-                    memory_logger.error(f"Failed to create memory fact: {fact}")
+            results = await asyncio.gather(
+                *(_create_fact(fact) for fact in extracted_facts), return_exceptions=True
+            )
+
+            memory_ids = []
+            for fact, result in zip(extracted_facts, results):
+                if isinstance(result, BaseException):
+                    memory_logger.error(f"Failed to create memory fact: {fact}: {result}")
+                elif result:
+                    memory_ids.append(result)
 
             if memory_ids:
+                # Only affects this process; other processes see the new count once
+                # their cached entry expires
+                self._count_cache.pop(user_id, None)
                 memory_logger.info(
                     f"✅ Created {len(memory_ids)} Mycelia memory objects from {len(extracted_facts)} facts"
                 )
@@ -506,8 +794,7 @@ class MyceliaMemoryService(MemoryServiceBase):
         Returns:
             List of matching MemoryEntry objects ordered by relevance
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_initialized()
 
         try:
             # Generate JWT token for this user
@@ -517,6 +804,7 @@ class MyceliaMemoryService(MemoryServiceBase):
             result = await self._call_resource(
                 action="list",
                 jwt_token=jwt_token,
+                user_id=user_id,
                 filters={},  # Auto-scoped by userId in Mycelia
                 options={
                     "searchTerm": query,
@@ -544,34 +832,43 @@ class MyceliaMemoryService(MemoryServiceBase):
             memory_logger.error(f"Failed to search memories via Mycelia: {e}")
             return []
 
-    async def get_all_memories(self, user_id: str, limit: int = 100) -> List[MemoryEntry]:
+    async def get_all_memories(
+        self, user_id: str, limit: int = 100, include_metadata: bool = True
+    ) -> List[MemoryEntry]:
         """Get all memories for a user from Mycelia.
 
         Args:
             user_id: User identifier
             limit: Maximum number of memories to return
+            include_metadata: When False, only id, content and creation time are
+                fetched and returned (metadata holds just the user_id)
 
         Returns:
             List of MemoryEntry objects for the user
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_initialized()
 
         try:
             # Generate JWT token for this user
             jwt_token = await self._get_user_jwt(user_id)
 
+            options: Dict[str, Any] = {"limit": limit, "sort": {"updatedAt": -1}}  # Most recent first
+            if not include_metadata:
+                options["projection"] = {"_id": 1, "details": 1, "createdAt": 1}
+
             # List all objects for this user (auto-scoped by Mycelia)
             result = await self._call_resource(
                 action="list",
                 jwt_token=jwt_token,
+                user_id=user_id,
                 filters={},  # Auto-scoped by userId
-                options={"limit": limit, "sort": {"updatedAt": -1}},  # Most recent first
+                options=options,
             )
 
             # Convert Mycelia objects to MemoryEntry objects
-            memories = [self._mycelia_object_to_memory_entry(obj, user_id) for obj in result]
-            return memories
+            if not include_metadata:
+                return [self._mycelia_object_to_light_entry(obj, user_id) for obj in result]
+            return [self._mycelia_object_to_memory_entry(obj, user_id) for obj in result]
 
         except Exception as e:
             memory_logger.error(f"Failed to get memories via Mycelia: {e}")
@@ -586,24 +883,30 @@ class MyceliaMemoryService(MemoryServiceBase):
         Returns:
             Total count of memories for the user, or None if not supported
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_initialized()
+
+        cached_count = self._count_cache.get(user_id)
+        if cached_count is not None:
+            return cached_count
 
         try:
             # Generate JWT token for this user
             jwt_token = await self._get_user_jwt(user_id)
 
             # Use Mycelia's mongo resource to count objects for this user
-            if not self._client:
-                raise RuntimeError("Mycelia client not initialized")
-
-            response = await self._client.post(
-                "/api/resource/tech.mycelia.mongo",
-                json={"action": "count", "collection": "objects", "query": {"userId": user_id}},
-                headers={"Authorization": f"Bearer {jwt_token}"},
+            response = await self._post(
+                MYCELIA_MONGO_PATH,
+                orjson.dumps(
+                    {"action": "count", "collection": "objects", "query": {"userId": user_id}}
+                ),
+                jwt_token,
             )
             response.raise_for_status()
-            return response.json()
+            # The count action normally returns a bare number; avoid a JSON parse for it
+            content = response.content.strip()
+            count = int(content) if content.isdigit() else orjson.loads(content)
+            self._count_cache[user_id] = count
+            return count
 
         except Exception as e:
             memory_logger.error(f"Failed to count memories via Mycelia: {e}")
@@ -621,8 +924,7 @@ class MyceliaMemoryService(MemoryServiceBase):
         Returns:
             MemoryEntry object if found, None otherwise
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_initialized()
 
         try:
             # Need user ID for JWT authentication
@@ -634,7 +936,9 @@ class MyceliaMemoryService(MemoryServiceBase):
             jwt_token = await self._get_user_jwt(user_id)
 
             # Get the object by ID (auto-scoped by userId in Mycelia)
-            result = await self._call_resource(action="get", jwt_token=jwt_token, id=memory_id)
+            result = await self._call_resource(
+                action="get", jwt_token=jwt_token, user_id=user_id, id=memory_id
+            )
 
             if result:
                 return self._mycelia_object_to_memory_entry(result, user_id)
@@ -666,8 +970,7 @@ class MyceliaMemoryService(MemoryServiceBase):
         Returns:
             True if update succeeded, False otherwise
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_initialized()
 
         try:
             # Need user ID for JWT authentication
@@ -709,7 +1012,11 @@ class MyceliaMemoryService(MemoryServiceBase):
 
             # Update the object (auto-scoped by userId in Mycelia)
             result = await self._call_resource(
-                action="update", jwt_token=jwt_token, id=memory_id, object=update_data
+                action="update",
+                jwt_token=jwt_token,
+                user_id=user_id,
+                id=memory_id,
+                object=update_data,
             )
 
             updated_count = result.get("modifiedCount", 0)
@@ -737,6 +1044,8 @@ class MyceliaMemoryService(MemoryServiceBase):
         Returns:
             True if successfully deleted, False otherwise
         """
+        await self._ensure_initialized()
+
         try:
             # Need user credentials for JWT - if not provided, we can't delete
             if not user_id:
@@ -747,10 +1056,13 @@ class MyceliaMemoryService(MemoryServiceBase):
             jwt_token = await self._get_user_jwt(user_id, user_email)
 
             # Delete the object (auto-scoped by userId in Mycelia)
-            result = await self._call_resource(action="delete", jwt_token=jwt_token, id=memory_id)
+            result = await self._call_resource(
+                action="delete", jwt_token=jwt_token, user_id=user_id, id=memory_id
+            )
 
             deleted_count = result.get("deletedCount", 0)
             if deleted_count > 0:
+                self._count_cache.pop(user_id, None)
                 memory_logger.info(f"✅ Deleted Mycelia memory object: {memory_id}")
                 return True
             else:
@@ -770,24 +1082,70 @@ class MyceliaMemoryService(MemoryServiceBase):
         Returns:
             Number of memories that were deleted
         """
+        await self._ensure_initialized()
+
         try:
             # Generate JWT token for this user
             jwt_token = await self._get_user_jwt(user_id)
 
-            # First, get all memory IDs for this user
-            result = await self._call_resource(
-                action="list",
-                jwt_token=jwt_token,
-                filters={},  # Auto-scoped by userId
-                options={"limit": 10000},  # Large limit to get all
-            )
+            # Prefer a single server-side deleteMany when Mycelia supports it
+            bulk_deleted = await self._bulk_delete_user_objects(jwt_token, user_id)
+            if bulk_deleted is not None:
+                self._count_cache.pop(user_id, None)
+                memory_logger.info(
+                    f"✅ Bulk deleted {bulk_deleted} Mycelia memories for user {user_id}"
+                )
+                return bulk_deleted
+
+            # Otherwise, page through the user's memory IDs and delete each page
+            # concurrently, bounded so we don't flood Mycelia
+            semaphore = asyncio.Semaphore(DELETE_CONCURRENCY)
+
+            async def _delete_one(memory_id: str) -> bool:
+                async with semaphore:
+                    return await self.delete_memory(memory_id, user_id)
 
-            # Delete each memory individually
             deleted_count = 0
-            for obj in result:
-                memory_id = self._extract_bson_id(obj.get("_id", ""))
-                if await self.delete_memory(memory_id, user_id):
-                    deleted_count += 1
+            failed_count = 0
+            previous_ids = None
+            while True:
+                # Deleted objects drop out of the _id-sorted listing, so only the
+                # ones that failed to delete need to be skipped on the next page
+                page = await self._call_resource(
+                    action="list",
+                    jwt_token=jwt_token,
+                    user_id=user_id,
+                    filters={},  # Auto-scoped by userId
+                    # Only IDs are needed, so skip the other fields
+                    options={
+                        "limit": DELETE_PAGE_SIZE,
+                        "skip": failed_count,
+                        "projection": {"_id": 1},
+                        "sort": {"_id": 1},
+                    },
+                )
+                memory_ids = [self._extract_bson_id(obj["_id"]) for obj in page if "_id" in obj]
+
+                # If Mycelia ignores skip, a page whose deletes all fail comes back
+                # unchanged; stop instead of retrying the same IDs forever
+                page_ids = set(memory_ids)
+                if page_ids == previous_ids:
+                    memory_logger.warning(
+                        f"Stopping Mycelia delete for user {user_id}: "
+                        f"{len(page_ids)} memories could not be deleted"
+                    )
+                    break
+                previous_ids = page_ids
+
+                results = await asyncio.gather(
+                    *(_delete_one(memory_id) for memory_id in memory_ids), return_exceptions=True
+                )
+                page_deleted = sum(1 for r in results if r is True)
+                deleted_count += page_deleted
+                failed_count += len(memory_ids) - page_deleted
+
+                if len(page) < DELETE_PAGE_SIZE:
+                    break
 
             memory_logger.info(f"✅ Deleted {deleted_count} Mycelia memories for user {user_id}")
             return deleted_count
@@ -796,6 +1154,36 @@ class MyceliaMemoryService(MemoryServiceBase):
             memory_logger.error(f"Failed to delete user memories via Mycelia: {e}")
             return 0
 
+    async def _bulk_delete_user_objects(self, jwt_token: str, user_id: str) -> Optional[int]:
+        """Delete all of a user's objects with one Mycelia mongo deleteMany call.
+
+        Args:
+            jwt_token: User's JWT token from Chronicle
+            user_id: User identifier
+
+        Returns:
+            Number of deleted objects, or None if bulk delete is not supported
+        """
+        try:
+            response = await self._post(
+                MYCELIA_MONGO_PATH,
+                orjson.dumps(
+                    {"action": "deleteMany", "collection": "objects", "query": {"userId": user_id}}
+                ),
+                jwt_token,
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            memory_logger.info(f"Mycelia bulk delete unavailable, deleting one by one: {e}")
+            return None
+
+        count = result.get("deletedCount") if isinstance(result, dict) else result
+        # bool is an int subclass, but a bare true/false is not a count
+        if isinstance(count, int) and not isinstance(count, bool):
+            return count
+        return None
+
     async def test_connection(self) -> bool:
         """Test connection to Mycelia service.
 
@@ -803,8 +1191,7 @@ class MyceliaMemoryService(MemoryServiceBase):
             True if connection is healthy, False otherwise
         """
         try:
-            if not self._initialized:
-                await self.initialize()
+            await self._ensure_initialized()
 
             if not self._client:
                 return False
@@ -820,45 +1207,40 @@ class MyceliaMemoryService(MemoryServiceBase):
     async def aclose(self) -> None:
         """Asynchronously close Mycelia client and cleanup resources."""
         memory_logger.info("Closing Mycelia memory service")
-        if self._client:
+        client, self._client = self._client, None
+        if client:
             try:
-                await self._client.aclose()
+                await client.aclose()
                 memory_logger.info("✅ Mycelia HTTP client closed successfully")
             except Exception as e:
                 memory_logger.error(f"Error closing Mycelia HTTP client: {e}")
         self._initialized = False
 
     def shutdown(self) -> None:
-        """Shutdown Mycelia client and cleanup resources (sync wrapper)."""
+        """Shutdown Mycelia client and cleanup resources (sync wrapper).
+
+        Prefer ``await aclose()`` from async code; this wrapper only schedules
+        the close when called while an event loop is running.
+        """
         memory_logger.info("Shutting down Mycelia memory service")
 
         if self._client:
             try:
-                # Try to get the current event loop
-                try:
-                    loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    # No running loop
-                    loop = None
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No running loop
+                loop = None
 
-                if loop and loop.is_running():
-                    # If we're in an async context, schedule the close operation on the running loop
+            try:
+                if loop:
+                    # In an async context: schedule the close on the running loop
                     memory_logger.info(
                         "Running event loop detected. Scheduling aclose() on the current loop."
                     )
-                    try:
-                        # Schedule the coroutine to run on the existing loop
-                        asyncio.ensure_future(self.aclose(), loop=loop)
-                        memory_logger.info("✅ Close operation scheduled on running event loop")
-                    except Exception as e:
-                        memory_logger.error(f"Error scheduling close on running loop: {e}")
+                    self._close_task = loop.create_task(self.aclose())
                 else:
-                    # No running loop, safe to use run_until_complete
-                    try:
-                        asyncio.get_event_loop().run_until_complete(self.aclose())
-                    except Exception as e:
-                        memory_logger.error(f"Error during shutdown: {e}")
+                    asyncio.run(self.aclose())
             except Exception as e:
-                memory_logger.error(f"Unexpected error during shutdown: {e}")
+                memory_logger.error(f"Error during shutdown: {e}")
 
         self._initialized = False
@@ -238,7 +238,8 @@ class OpenMemoryMCPService(MemoryServiceBase):
     async def get_all_memories(
         self, 
         user_id: str, 
-        limit: int = 100
+        limit: int = 100,
+        include_metadata: bool = True
     ) -> List[MemoryEntry]:
         """Get all memories for a specific user.
         
@@ -248,6 +249,8 @@ class OpenMemoryMCPService(MemoryServiceBase):
         Args:
             user_id: User identifier
             limit: Maximum number of memories to return
+            include_metadata: Accepted for interface compatibility; entries
+                always include metadata
             
         Returns:
             List of MemoryEntry objects for the user
@@ -124,6 +124,24 @@ def shutdown_memory_service() -> None:
             _memory_service = None
 
 
+async def async_shutdown_memory_service() -> None:
+    """Shutdown the global memory service from an async context.
+
+    Unlike shutdown_memory_service(), this awaits the provider's aclose() so
+    network clients are closed before the event loop goes away.
+    """
+    global _memory_service
+
+    if _memory_service is not None:
+        try:
+            await _memory_service.aclose()
+            memory_logger.info("🔄 Memory service shut down")
+        except Exception as e:
+            memory_logger.error(f"Error shutting down memory service: {e}")
+        finally:
+            _memory_service = None
+
+
 def reset_memory_service() -> None:
     """Reset the global memory service (useful for testing)."""
     global _memory_service
@@ -134,12 +134,14 @@ class RegistryBatchTranscriptionProvider(BatchTranscriptionProvider):
                     logger.info(f"DEBUG Registry: Deepgram alternative keys: {list(alt.keys())}")
 
         # Extract normalized shape
-        text, words, segments = "", [], []
+        text, words, segments, confidence = "", [], [], None
         extract = (op.get("response", {}) or {}).get("extract") or {}
         if extract:
             text = _dotted_get(data, extract.get("text")) or ""
             words = _dotted_get(data, extract.get("words")) or []
             segments = _dotted_get(data, extract.get("segments")) or []
+            # Optional aggregate confidence (e.g. Deepgram alternative confidence)
+            confidence = _dotted_get(data, extract.get("confidence"))
 
             # DEBUG: Log what we extracted
             logger.info(f"DEBUG Registry: Extracted {len(segments)} segments from response")
@@ -147,7 +149,10 @@ class RegistryBatchTranscriptionProvider(BatchTranscriptionProvider):
                 logger.info(f"DEBUG Registry: First segment keys: {list(segments[0].keys()) if isinstance(segments[0], dict) else 'not a dict'}")
                 logger.info(f"DEBUG Registry: First segment: {segments[0]}")
 
-        return {"text": text, "words": words, "segments": segments}
+        result = {"text": text, "words": words, "segments": segments}
+        if confidence is not None:
+            result["confidence"] = confidence
+        return result
 
 class RegistryStreamingTranscriptionProvider(StreamingTranscriptionProvider):
     """Streaming transcription provider using a config-driven WebSocket template."""
@@ -12,6 +12,47 @@ from advanced_omi_backend.services.transcription import get_transcription_provid
 logger = logging.getLogger(__name__)
 
 
+class _DeepgramBatchConsumer(BaseAudioStreamConsumer):
+    """Stream consumer that transcribes buffered audio with a batch provider."""
+
+    def __init__(self, provider, redis_client, buffer_chunks: int):
+        super().__init__("deepgram", redis_client, buffer_chunks)
+        self._transcription_provider = provider
+
+    async def transcribe_audio(self, audio_data: bytes, sample_rate: int) -> dict:
+        """Transcribe using registry-driven transcription provider."""
+        try:
+            result = await self._transcription_provider.transcribe(
+                audio_data=audio_data,
+                sample_rate=sample_rate,
+                diarize=True
+            )
+
+            words = result.get("words") or []
+
+            # Prefer the provider's aggregate confidence; otherwise average word
+            # confidences in a single pass without building an intermediate list
+            confidence = result.get("confidence")
+            if confidence is None:
+                total, count = 0.0, 0
+                for w in words:
+                    if "confidence" in w:
+                        total += w["confidence"]
+                        count += 1
+                confidence = total / count if count else 0.0
+
+            return {
+                "text": result.get("text", ""),
+                "words": words,
+                "segments": result.get("segments", []),
+                "confidence": confidence
+            }
+
+        except Exception as e:
+            logger.error(f"Deepgram transcription failed: {e}", exc_info=True)
+            raise
+
+
 class DeepgramStreamConsumer:
     """
     Deepgram consumer for Redis Streams architecture.
@@ -43,45 +84,7 @@ class DeepgramStreamConsumer:
                 "Failed to load transcription provider. Ensure config.yml has a default 'stt' model configured."
             )
 
-        # Create a concrete subclass that implements transcribe_audio
-        class _ConcreteConsumer(BaseAudioStreamConsumer):
-            def __init__(inner_self, provider_name: str, redis_client, buffer_chunks: int):
-                super().__init__(provider_name, redis_client, buffer_chunks)
-                inner_self._transcription_provider = self.provider
-
-            async def transcribe_audio(inner_self, audio_data: bytes, sample_rate: int) -> dict:
-                """Transcribe using registry-driven transcription provider."""
-                try:
-                    result = await inner_self._transcription_provider.transcribe(
-                        audio_data=audio_data,
-                        sample_rate=sample_rate,
-                        diarize=True
-                    )
-
-                    # Calculate confidence
-                    confidence = 0.0
-                    if result.get("words"):
-                        confidences = [
-                            w.get("confidence", 0)
-                            for w in result["words"]
-                            if "confidence" in w
-                        ]
-                        if confidences:
-                            confidence = sum(confidences) / len(confidences)
-
-                    return {
-                        "text": result.get("text", ""),
-                        "words": result.get("words", []),
-                        "segments": result.get("segments", []),
-                        "confidence": confidence
-                    }
-
-                except Exception as e:
-                    logger.error(f"Deepgram transcription failed: {e}", exc_info=True)
-                    raise
-
-        # Instantiate the concrete consumer
-        self._consumer = _ConcreteConsumer("deepgram", redis_client, buffer_chunks)
+        self._consumer = _DeepgramBatchConsumer(self.provider, redis_client, buffer_chunks)
 
     async def start_consuming(self):
         """Delegate to base consumer."""
@@ -5,17 +5,25 @@ Extracted from legacy TranscriptionService to be reusable across V2 architecture
 """
 
 import asyncio
+import functools
+import hashlib
+import json
 import logging
+import re
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 from advanced_omi_backend.config import get_speech_detection_settings
-from advanced_omi_backend.llm_client import async_generate
+from advanced_omi_backend.llm_client import async_generate, get_llm_client
 
 logger = logging.getLogger(__name__)
 
+# Speech detection thresholds come from the environment, which doesn't change
+# at runtime, so read them once instead of on every analyze_speech() call
+_get_speech_settings_cached = functools.lru_cache(maxsize=1)(get_speech_detection_settings)
+
 
 def is_meaningful_speech(combined_results: dict) -> bool:
     """
@@ -43,8 +51,66 @@ def is_meaningful_speech(combined_results: dict) -> bool:
 
     transcript_data = {"text": combined_results["text"], "words": combined_results.get("words", [])}
 
-    speech_analysis = analyze_speech(transcript_data)
-    return speech_analysis["has_speech"]
+    return _has_meaningful_speech(transcript_data, _get_speech_settings_cached())
+
+
+def _scan_valid_words(
+    words: List[Dict[str, Any]], min_confidence: float
+) -> tuple[int, Optional[float], float]:
+    """
+    Count words above the confidence threshold and find the valid speech span.
+
+    Single pass, without building a filtered list. Shared by analyze_speech() and
+    _has_meaningful_speech() so both apply exactly the same word filter.
+
+    Args:
+        words: Word-level data with "confidence", "start" and "end"
+        min_confidence: Minimum confidence for a word to count
+
+    Returns:
+        Tuple of (valid word count, first valid word's start or None, last valid word's end)
+    """
+    valid_count = 0
+    speech_start = None
+    speech_end = 0
+    for w in words:
+        if w.get("confidence", 0) >= min_confidence:
+            valid_count += 1
+            if speech_start is None:
+                speech_start = w.get("start", 0)
+            speech_end = w.get("end", 0)
+    return valid_count, speech_start, speech_end
+
+
+def _has_meaningful_speech(transcript_data: dict, settings: dict) -> bool:
+    """
+    Boolean-only equivalent of analyze_speech()["has_speech"].
+
+    Applies the same thresholds without building the result dict or reason string,
+    for callers that only need the decision.
+
+    Args:
+        transcript_data: Dictionary with "text" and optional "words" (see analyze_speech)
+        settings: Speech detection settings from get_speech_detection_settings()
+
+    Returns:
+        bool: True if meaningful speech detected, False otherwise
+    """
+    min_words = settings["min_words"]
+    min_confidence = settings["min_confidence"]
+    words = transcript_data.get("words", [])
+
+    if words:
+        valid_count, speech_start, speech_end = _scan_valid_words(words, min_confidence)
+
+        if valid_count < min_words:
+            return False
+        if valid_count:
+            return speech_end - speech_start >= settings.get("min_duration", 10.0)
+
+    # Text-only fallback (when no word-level data available)
+    text = transcript_data.get("text", "").strip()
+    return bool(text) and len(text.split()) >= min_words
 
 
 def analyze_speech(transcript_data: dict) -> dict:
@@ -78,26 +144,25 @@ def analyze_speech(transcript_data: dict) -> dict:
         >>> if result["has_speech"]:
         >>>     print(f"Speech detected: {result['word_count']} words, {result['duration']}s")
     """
-    settings = get_speech_detection_settings()
+    settings = _get_speech_settings_cached()
+    min_words = settings["min_words"]
+    min_confidence = settings["min_confidence"]
     words = transcript_data.get("words", [])
 
     # Method 1: Word-level analysis (preferred - has confidence scores and timing)
     if words:
-        # Filter by confidence threshold
-        valid_words = [w for w in words if w.get("confidence", 0) >= settings["min_confidence"]]
+        valid_count, speech_start, speech_end = _scan_valid_words(words, min_confidence)
 
-        if len(valid_words) < settings["min_words"]:
+        if valid_count < min_words:
             return {
                 "has_speech": False,
-                "reason": f"Not enough valid words ({len(valid_words)} < {settings['min_words']})",
-                "word_count": len(valid_words),
+                "reason": f"Not enough valid words ({valid_count} < {min_words})",
+                "word_count": valid_count,
                 "duration": 0.0,
             }
 
         # Calculate speech duration from word timing
-        if valid_words:
-            speech_start = valid_words[0].get("start", 0)
-            speech_end = valid_words[-1].get("end", 0)
+        if valid_count:
             speech_duration = speech_end - speech_start
 
             # Check minimum duration threshold
@@ -106,24 +171,24 @@ def analyze_speech(transcript_data: dict) -> dict:
                 return {
                     "has_speech": False,
                     "reason": f"Speech too short ({speech_duration:.1f}s < {min_duration}s)",
-                    "word_count": len(valid_words),
+                    "word_count": valid_count,
                     "duration": speech_duration,
                 }
 
             return {
                 "has_speech": True,
-                "word_count": len(valid_words),
+                "word_count": valid_count,
                 "speech_start": speech_start,
                 "speech_end": speech_end,
                 "duration": speech_duration,
-                "reason": f"Valid speech detected ({len(valid_words)} words, {speech_duration:.1f}s)",
+                "reason": f"Valid speech detected ({valid_count} words, {speech_duration:.1f}s)",
             }
 
     # Method 2: Text-only fallback (when no word-level data available)
     text = transcript_data.get("text", "").strip()
     if text:
         word_count = len(text.split())
-        if word_count >= settings["min_words"]:
+        if word_count >= min_words:
             return {
                 "has_speech": True,
                 "word_count": word_count,
@@ -143,128 +208,396 @@ def analyze_speech(transcript_data: dict) -> dict:
     }
 
 
-async def generate_title(text: str, segments: Optional[list] = None) -> str:
-    """
-    Generate an LLM-powered title from conversation text.
+# Maximum transcript characters embedded in title/summary prompts
+MAX_DETAILED_CHARS = 8000
 
-    Args:
-        text: Conversation transcript (used if segments not provided)
-        segments: Optional list of speaker segments with structure:
-            [{"speaker": str, "text": str, "start": float, "end": float}, ...]
-            If provided, uses speaker-aware conversation formatting
+# Deterministic output so identical transcripts produce identical (cacheable) results
+SUMMARY_TEMPERATURE = 0.0
 
-    Returns:
-        str: Generated title (3-6 words) or fallback
+# Transcripts below either limit get extractive title/summaries instead of an LLM call
+SHORT_TRANSCRIPT_CHARS = 200
+SHORT_TRANSCRIPT_WORDS = 20
 
-    Note:
-        Title intentionally does NOT include speaker names - focuses on topic/theme only.
+# Whitespace and quotes trimmed from LLM output in a single strip() pass
+_STRIP_CHARS = " \t\n\r\"'"
+
+# A complete "key": "string value" pair for one of the artifact fields
+_ARTIFACT_FIELD = re.compile(
+    r'"(title|short_summary|detailed_summary)"\s*:\s*("(?:[^"\\]|\\.)*")'
+)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def _parse_artifacts_response(response: str) -> Dict[str, Any]:
     """
-    # Format conversation text from segments if provided
-    if segments:
-        conversation_text = ""
-        for segment in segments[:10]:  # Use first 10 segments for title generation
-            segment_text = segment.get("text", "").strip()
-            if segment_text:
-                conversation_text += f"{segment_text}\n"
-        text = conversation_text if conversation_text.strip() else text
+    Parse the JSON object returned for generate_conversation_artifacts().
 
-    if not text or len(text.strip()) < 10:
-        return "Conversation"
+    If the object is truncated (e.g. the server's token limit was hit) or otherwise
+    malformed, fields whose string values were emitted completely are recovered.
 
-    try:
-        prompt = f"""Generate a concise, descriptive title (3-6 words) for this conversation transcript:
+    Args:
+        response: Raw LLM response text
 
-"{text[:500]}"
+    Returns:
+        dict: Parsed fields (may be missing keys)
 
-Rules:
-- Maximum 6 words
-- Capture the main topic or theme
-- Do NOT include speaker names or participants
-- No quotes or special characters
-- Examples: "Planning Weekend Trip", "Work Project Discussion", "Medical Appointment"
+    Raises:
+        ValueError: If no JSON object or recoverable field is found
+    """
+    # Models sometimes wrap JSON in markdown fences or add a preamble
+    json_start = response.find("{")
+    if json_start == -1:
+        raise ValueError("LLM response did not contain a JSON object")
 
-Title:"""
+    # strict=False accepts raw newlines inside strings (multi-paragraph summaries)
+    try:
+        parsed = json.loads(response[json_start : response.rfind("}") + 1], strict=False)
+        if isinstance(parsed, dict):
+            return parsed
+    except ValueError:
+        pass
+
+    recovered = {}
+    for match in _ARTIFACT_FIELD.finditer(response, json_start):
+        try:
+            recovered[match.group(1)] = json.loads(match.group(2), strict=False)
+        except ValueError:
+            continue
+    if not recovered:
+        raise ValueError("LLM response JSON could not be parsed")
+    logger.warning(f"Recovered {sorted(recovered)} from incomplete LLM JSON response")
+    return recovered
+
+
+def _plain_transcript(text: str, segments: Optional[list]) -> str:
+    """
+    Return the transcript without speaker labels.
 
-        title = await async_generate(prompt, temperature=0.3)
-        return title.strip().strip('"').strip("'") or "Conversation"
+    Args:
+        text: Conversation transcript
+        segments: Optional list of speaker segments; their text is used if present
 
-    except Exception as e:
-        logger.warning(f"Failed to generate LLM title: {e}")
-        # Fallback to simple title generation
-        words = text.split()[:6]
-        title = " ".join(words)
-        return title[:40] + "..." if len(title) > 40 else title or "Conversation"
+    Returns:
+        str: Segment text joined by newlines, or text if segments are missing or empty
+    """
+    if segments:
+        plain_text = "\n".join(
+            segment_text
+            for segment_text in (segment.get("text", "").strip() for segment in segments)
+            if segment_text
+        )
+        if plain_text:
+            return plain_text
+    return text
 
 
-async def generate_short_summary(text: str, segments: Optional[list] = None) -> str:
+def _format_conversation_text(text: str, segments: Optional[list]) -> str:
     """
-    Generate a brief LLM-powered summary from conversation text.
+    Format a transcript for title/summary prompts.
 
     Args:
-        text: Conversation transcript (used if segments not provided)
-        segments: Optional list of speaker segments with structure:
-            [{"speaker": str, "text": str, "start": float, "end": float}, ...]
-            If provided, includes speaker context in summary
+        text: Conversation transcript (used if segments not provided or empty)
+        segments: Optional list of speaker segments; formatted as "speaker: text" lines
 
     Returns:
-        str: Generated short summary (1-2 sentences, max 120 chars) or fallback
+        str: Formatted transcript, capped at MAX_DETAILED_CHARS
     """
-    # Format conversation text from segments if provided
     conversation_text = text
-    include_speakers = False
 
     if segments:
-        formatted_text = ""
-        speakers_in_conv = set()
+        # Collect lines and join once; repeated += is quadratic on long conversations
+        parts = []
+        char_count = 0
         for segment in segments:
             speaker = segment.get("speaker", "")
             segment_text = segment.get("text", "").strip()
             if segment_text:
-                if speaker:
-                    formatted_text += f"{speaker}: {segment_text}\n"
-                    speakers_in_conv.add(speaker)
-                else:
-                    formatted_text += f"{segment_text}\n"
+                line = f"{speaker}: {segment_text}\n" if speaker else f"{segment_text}\n"
+                parts.append(line)
+                char_count += len(line)
+                # Segments past the prompt budget would be truncated anyway
+                if char_count > MAX_DETAILED_CHARS:
+                    break
+        formatted_text = "".join(parts)
 
         if formatted_text.strip():
             conversation_text = formatted_text
-            include_speakers = len(speakers_in_conv) > 0
 
-    if not conversation_text or len(conversation_text.strip()) < 10:
-        return "No content"
+    # Cap the transcript sent to the LLM; prefill cost grows with prompt length
+    if len(conversation_text) > MAX_DETAILED_CHARS:
+        conversation_text = conversation_text[:MAX_DETAILED_CHARS] + "\n...[truncated]"
+
+    return conversation_text
+
+
+def _is_short_transcript(text: str) -> bool:
+    """Check whether a transcript is too short to be worth an LLM call."""
+    text = text.strip()
+    return len(text) < SHORT_TRANSCRIPT_CHARS or len(text.split()) < SHORT_TRANSCRIPT_WORDS
+
+
+def _extractive_artifacts(text: str, conversation_text: str) -> Dict[str, str]:
+    """
+    Build title and summaries directly from a short transcript without the LLM.
+
+    Args:
+        text: Plain transcript, used for title and short summary (no speaker labels)
+        conversation_text: Formatted transcript, used as the detailed summary
+
+    Returns:
+        dict: {"title": str, "short_summary": str, "detailed_summary": str}
+    """
+    text = " ".join(text.split())
+    first_sentence = _SENTENCE_END.split(text, 1)[0]
+    title_words = " ".join(first_sentence.split()[:6]).rstrip(".!?,;:").split()
+    lines = conversation_text.split("\n")
+    cleaned = "\n".join(line.strip() for line in lines if line.strip())
+    return {
+        # Uppercase only each word's first letter; str.title() would turn
+        # "I'm" into "I'M" and lowercase acronyms
+        "title": " ".join(word[:1].upper() + word[1:] for word in title_words) or "Conversation",
+        "short_summary": first_sentence[:120] or "No content",
+        "detailed_summary": cleaned or "No meaningful content to summarize",
+    }
 
+
+# Generated artifacts are cached in Redis keyed by a hash of model, temperature and
+# prompt. Jobs run in short-lived RQ work-horse processes, so an in-process cache
+# would be empty for every job; Redis lets a retried or re-enqueued job reuse the
+# artifacts of an earlier attempt on the same transcript.
+ARTIFACTS_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_ARTIFACT_KEYS = ("title", "short_summary", "detailed_summary")
+
+
+def _artifacts_cache_key(prompt: str) -> str:
+    """Return the Redis key for artifacts generated from a prompt by the current model."""
+    # Include the model so a config change or reset_llm_client() can't serve
+    # artifacts generated by a different model
+    model = get_llm_client().get_default_model()
+    digest = hashlib.sha256(f"{model}\x00{SUMMARY_TEMPERATURE}\x00{prompt}".encode()).hexdigest()
+    return f"llm:artifacts:{digest}"
+
+
+async def _get_cached_artifacts(redis_client, cache_key: str) -> Optional[Dict[str, str]]:
+    """Return cached artifacts, or None on a miss, a read failure or an unusable entry."""
     try:
-        speaker_instruction = (
-            '- Include speaker names when relevant (e.g., "John discusses X with Sarah")\n'
-            if include_speakers
-            else ""
-        )
+        cached = await redis_client.get(cache_key)
+        if cached is None:
+            return None
+        artifacts = json.loads(cached)
+    except Exception as e:
+        logger.warning(f"Artifacts cache read failed: {e}")
+        return None
+
+    if isinstance(artifacts, dict) and all(
+        isinstance(artifacts.get(key), str) for key in _ARTIFACT_KEYS
+    ):
+        logger.debug(f"Artifacts cache hit ({cache_key})")
+        return artifacts
+    return None
 
-        prompt = f"""Generate a brief, informative summary (1-2 sentences, max 120 characters) for this conversation:
 
-"{conversation_text[:1000]}"
+# Instructions for generate_conversation_artifacts(). Kept constant (no per-call
+# interpolation) and placed before the transcript so providers with automatic
+# prefix caching (OpenAI, vLLM, Ollama) can reuse the prefill across conversations.
+_ARTIFACTS_INSTRUCTIONS = """Generate a title, a short summary, and a detailed summary for the conversation transcript below.
 
-Rules:
+Respond with a single JSON object and nothing else, using exactly these keys:
+{"title": "...", "short_summary": "...", "detailed_summary": "..."}
+
+Title rules:
+- Concise and descriptive, 3-6 words
+- Capture the main topic or theme
+- Do NOT include speaker names or participants
+- No quotes or special characters
+- Examples: "Planning Weekend Trip", "Work Project Discussion", "Medical Appointment"
+
+Short summary rules:
 - Maximum 120 characters
 - 1-2 complete sentences
-{speaker_instruction}- Capture key topics and outcomes
+- Capture key topics and outcomes
 - Use present tense
 - Be specific and informative
 
-Summary:"""
+Detailed summary rules:
+- A high-quality, detailed summary that captures the full information and context of what was discussed. This is NOT a brief summary - provide comprehensive coverage.
+- We know it's a conversation, so no need to say "This conversation involved..."
+- Provide complete coverage of all topics, points, and important details discussed
+- Correct obvious transcription errors and remove filler words (um, uh, like, you know)
+- Organize information logically by topic or chronologically as appropriate
+- Use clear, well-structured paragraphs or bullet points, but make the length relative to the amound of content.
+- Maintain the meaning and intent of what was said, but improve clarity and coherence
+- Include relevant context, decisions made, action items mentioned, and conclusions reached
+- Write in a natural, flowing narrative style
+- Only include word-for-word quotes if it's more efficiency than rephrasing
+- Focus on substantive content - what was actually discussed and decided
+
+Speaker rules (summaries only, when lines are prefixed with speaker names):
+- Include speaker names when relevant (e.g., "John discusses X with Sarah")
+- Attribute key points and statements to specific speakers when relevant
+- Capture the flow of conversation between participants
+- Note any agreements, disagreements, or important exchanges"""
+
+# Complete prompt template; only the transcript is substituted per call
+_ARTIFACTS_TEMPLATE = _ARTIFACTS_INSTRUCTIONS + "\n\nTRANSCRIPT:\n%s\n\nJSON:"
 
-        summary = await async_generate(prompt, temperature=0.3)
-        return summary.strip().strip('"').strip("'") or "No content"
+
+async def generate_conversation_artifacts(
+    text: str, segments: Optional[list] = None, redis_client=None
+) -> Dict[str, str]:
+    """
+    Generate title, short summary, and detailed summary with a single LLM call.
+
+    The three artifacts share the same transcript context, so requesting them
+    together as one JSON object saves two round-trips and two prompt prefills
+    compared to calling the LLM once per artifact.
+
+    Args:
+        text: Conversation transcript (used if segments not provided)
+        segments: Optional list of speaker segments with structure:
+            [{"speaker": str, "text": str, "start": float, "end": float}, ...]
+            If provided, includes speaker context in the summaries
+        redis_client: Optional async Redis client used to cache the generated artifacts
+
+    Returns:
+        dict: {"title": str, "short_summary": str, "detailed_summary": str}
+            Any artifact the LLM fails to produce is replaced with a fallback.
+
+    Note:
+        Title intentionally does NOT include speaker names - focuses on topic/theme only.
+    """
+    conversation_text = _format_conversation_text(text, segments)
+
+    if not conversation_text or len(conversation_text.strip()) < 10:
+        return {
+            "title": "Conversation",
+            "short_summary": "No content",
+            "detailed_summary": "No meaningful content to summarize",
+        }
+
+    # Judge length on the unlabeled text; "Speaker N:" prefixes would inflate it
+    plain_text = _plain_transcript(text, segments)
+    if _is_short_transcript(plain_text):
+        return _extractive_artifacts(plain_text, conversation_text)
+
+    # Static instructions first, transcript last, so the shared prefix is
+    # byte-identical across calls and can be served from provider prefix caches
+    prompt = _ARTIFACTS_TEMPLATE % conversation_text
+
+    artifacts = {}
+    cache_key = None
+    try:
+        if redis_client is not None:
+            cache_key = _artifacts_cache_key(prompt)
+            cached = await _get_cached_artifacts(redis_client, cache_key)
+            if cached is not None:
+                return cached
+
+        # No max_tokens: the detailed summary has no fixed length, and a cut-off
+        # response loses the closing brace of the JSON object
+        response = await async_generate(prompt, temperature=SUMMARY_TEMPERATURE)
+        parsed = _parse_artifacts_response(response)
+
+        for key in _ARTIFACT_KEYS:
+            value = parsed.get(key)
+            if isinstance(value, str):
+                value = value.strip(_STRIP_CHARS)
+                if value:
+                    artifacts[key] = value
 
     except Exception as e:
-        logger.warning(f"Failed to generate LLM short summary: {e}")
-        # Fallback to simple summary generation
-        return (
+        logger.warning(f"Failed to generate LLM title/summaries: {e}")
+
+    # Cache only complete LLM results; an unparseable or truncated response would
+    # otherwise be replayed by every retry of the same transcript
+    if cache_key is not None and len(artifacts) == len(_ARTIFACT_KEYS):
+        try:
+            await redis_client.set(cache_key, json.dumps(artifacts), ex=ARTIFACTS_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Artifacts cache write failed: {e}")
+
+    # Fallbacks for anything the LLM didn't produce
+    if "title" not in artifacts:
+        # Built from unlabeled text so the fallback never contains speaker names
+        words = plain_text.split()[:6]
+        title = " ".join(words)
+        artifacts["title"] = title[:40] + "..." if len(title) > 40 else title or "Conversation"
+
+    if "short_summary" not in artifacts:
+        artifacts["short_summary"] = (
             conversation_text[:120] + "..."
             if len(conversation_text) > 120
             else conversation_text or "No content"
         )
 
+    if "detailed_summary" not in artifacts:
+        lines = conversation_text.split("\n")
+        cleaned = "\n".join(line.strip() for line in lines if line.strip())
+        artifacts["detailed_summary"] = (
+            cleaned[:2000] + "..."
+            if len(cleaned) > 2000
+            else cleaned or "No meaningful content to summarize"
+        )
+
+    return artifacts
+
+
+# In-flight fused generations keyed by (text, segments), so the individual
+# generate_* wrappers awaited together share a single LLM call
+_inflight_artifacts: Dict[tuple, asyncio.Future] = {}
+
+
+async def _get_conversation_artifacts(text: str, segments: Optional[list]) -> Dict[str, str]:
+    """Return artifacts for a transcript, joining an identical in-flight generation if any."""
+    key = (text, repr(segments))
+    # No await between lookup and insert, so concurrent callers can't both miss
+    future = _inflight_artifacts.get(key)
+    if future is None:
+        future = asyncio.ensure_future(generate_conversation_artifacts(text, segments))
+        _inflight_artifacts[key] = future
+        future.add_done_callback(lambda _: _inflight_artifacts.pop(key, None))
+    # Shield so one cancelled caller doesn't cancel the call for the others
+    return await asyncio.shield(future)
+
+
+async def generate_title(text: str, segments: Optional[list] = None) -> str:
+    """
+    Generate an LLM-powered title from conversation text.
+
+    Args:
+        text: Conversation transcript (used if segments not provided)
+        segments: Optional list of speaker segments with structure:
+            [{"speaker": str, "text": str, "start": float, "end": float}, ...]
+
+    Returns:
+        str: Generated title (3-6 words) or fallback
+
+    Note:
+        Title intentionally does NOT include speaker names - focuses on topic/theme only.
+        Prefer generate_conversation_artifacts() when more than the title is needed.
+    """
+    artifacts = await _get_conversation_artifacts(text, segments)
+    return artifacts["title"]
+
+
+async def generate_short_summary(text: str, segments: Optional[list] = None) -> str:
+    """
+    Generate a brief LLM-powered summary from conversation text.
+
+    Args:
+        text: Conversation transcript (used if segments not provided)
+        segments: Optional list of speaker segments with structure:
+            [{"speaker": str, "text": str, "start": float, "end": float}, ...]
+            If provided, includes speaker context in summary
+
+    Returns:
+        str: Generated short summary (1-2 sentences, max 120 chars) or fallback
+    """
+    artifacts = await _get_conversation_artifacts(text, segments)
+    return artifacts["short_summary"]
+
 
 # Backward compatibility alias
 async def generate_summary(text: str) -> str:
@@ -294,77 +627,8 @@ async def generate_detailed_summary(text: str, segments: Optional[list] = None)
     Returns:
         str: Comprehensive detailed summary (multiple paragraphs) or fallback
     """
-    # Format conversation text from segments if provided
-    conversation_text = text
-    include_speakers = False
-
-    if segments:
-        formatted_text = ""
-        speakers_in_conv = set()
-        for segment in segments:
-            speaker = segment.get("speaker", "")
-            segment_text = segment.get("text", "").strip()
-            if segment_text:
-                if speaker:
-                    formatted_text += f"{speaker}: {segment_text}\n"
-                    speakers_in_conv.add(speaker)
-                else:
-                    formatted_text += f"{segment_text}\n"
-
-        if formatted_text.strip():
-            conversation_text = formatted_text
-            include_speakers = len(speakers_in_conv) > 0
-
-    if not conversation_text or len(conversation_text.strip()) < 10:
-        return "No meaningful content to summarize"
-
-    try:
-        speaker_instruction = (
-            """- Attribute key points and statements to specific speakers when relevant
-- Capture the flow of conversation between participants
-- Note any agreements, disagreements, or important exchanges
-"""
-            if include_speakers
-            else ""
-        )
-
-        prompt = f"""Generate a comprehensive, detailed summary of this conversation transcript.
-
-TRANSCRIPT:
-"{conversation_text}"
-
-INSTRUCTIONS:
-Your task is to create a high-quality, detailed summary of a conversation transcription that captures the full information and context of what was discussed. This is NOT a brief summary - provide comprehensive coverage.
-
-Rules:
-- We know it's a conversation, so no need to say "This conversation involved..."
-- Provide complete coverage of all topics, points, and important details discussed
-- Correct obvious transcription errors and remove filler words (um, uh, like, you know)
-- Organize information logically by topic or chronologically as appropriate
-- Use clear, well-structured paragraphs or bullet points, but make the length relative to the amound of content.
-- Maintain the meaning and intent of what was said, but improve clarity and coherence
-- Include relevant context, decisions made, action items mentioned, and conclusions reached
-{speaker_instruction}- Write in a natural, flowing narrative style
-- Only include word-for-word quotes if it's more efficiency than rephrasing
-- Focus on substantive content - what was actually discussed and decided
-
-Think of this as creating a high-quality information set that someone could use to understand everything important that happened in this conversation without reading the full transcript.
-
-DETAILED SUMMARY:"""
-
-        summary = await async_generate(prompt, temperature=0.3)
-        return summary.strip().strip('"').strip("'") or "No meaningful content to summarize"
-
-    except Exception as e:
-        logger.warning(f"Failed to generate detailed summary: {e}")
-        # Fallback to returning cleaned transcript
-        lines = conversation_text.split("\n")
-        cleaned = "\n".join(line.strip() for line in lines if line.strip())
-        return (
-            cleaned[:2000] + "..."
-            if len(cleaned) > 2000
-            else cleaned or "No meaningful content to summarize"
-        )
+    artifacts = await _get_conversation_artifacts(text, segments)
+    return artifacts["detailed_summary"]
 
 
 # Backward compatibility aliases for deprecated speaker-specific methods
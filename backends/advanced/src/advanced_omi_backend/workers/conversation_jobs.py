@@ -529,11 +529,7 @@ async def generate_title_summary_job(conversation_id: str, *, redis_client=None)
         Dict with generated title, summary, and detailed_summary
     """
     from advanced_omi_backend.models.conversation import Conversation
-    from advanced_omi_backend.utils.conversation_utils import (
-        generate_title,
-        generate_short_summary,
-        generate_detailed_summary,
-    )
+    from advanced_omi_backend.utils.conversation_utils import generate_conversation_artifacts
 
     logger.info(f"📝 Starting title/summary generation for conversation {conversation_id}")
 
@@ -571,18 +567,14 @@ async def generate_title_summary_job(conversation_id: str, *, redis_client=None)
                 for seg in segments
             ]
 
-        # Generate all three summaries in parallel for efficiency
-        import asyncio
-
-        title, short_summary, detailed_summary = await asyncio.gather(
-            generate_title(transcript_text, segments=segment_dicts),
-            generate_short_summary(transcript_text, segments=segment_dicts),
-            generate_detailed_summary(transcript_text, segments=segment_dicts),
+        # Generate all three artifacts with a single LLM call
+        artifacts = await generate_conversation_artifacts(
+            transcript_text, segments=segment_dicts, redis_client=redis_client
         )
 
-        conversation.title = title
-        conversation.summary = short_summary
-        conversation.detailed_summary = detailed_summary
+        conversation.title = artifacts["title"]
+        conversation.summary = artifacts["short_summary"]
+        conversation.detailed_summary = artifacts["detailed_summary"]
 
         logger.info(f"✅ Generated title: '{conversation.title}'")
         logger.info(f"✅ Generated summary: '{conversation.summary}'")
@@ -0,0 +1,189 @@
+"""
+Tests for title/summary generation in conversation_utils.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from advanced_omi_backend.utils import conversation_utils
+from advanced_omi_backend.utils.conversation_utils import generate_conversation_artifacts
+
+SEGMENTS = [
+    {
+        "speaker": "Speaker 0",
+        "text": "I'm going to the hardware store later to pick up paint for the kitchen, "
+        "the grey one we picked out on Sunday.",
+        "start": 0.0,
+        "end": 4.0,
+    },
+    {
+        "speaker": "Speaker 1",
+        "text": "Can you grab some brushes and tape too, we ran out last weekend when "
+        "we did the hallway and the bathroom ceiling.",
+        "start": 4.0,
+        "end": 9.0,
+    },
+]
+TEXT = " ".join(segment["text"] for segment in SEGMENTS)
+
+
+class TestGenerateConversationArtifacts(unittest.TestCase):
+
+    def setUp(self):
+        self.generate_patcher = patch.object(
+            conversation_utils, "async_generate", new_callable=AsyncMock
+        )
+        self.mock_generate = self.generate_patcher.start()
+        self.addCleanup(self.generate_patcher.stop)
+
+    def _generate(self, response):
+        self.mock_generate.return_value = response
+        return asyncio.run(generate_conversation_artifacts(TEXT, segments=SEGMENTS))
+
+    def test_valid_json(self):
+        artifacts = self._generate(
+            '{"title": "Kitchen Painting Supplies", "short_summary": "Paint run planned.", '
+            '"detailed_summary": "Speaker 0 buys paint."}'
+        )
+
+        self.mock_generate.assert_awaited_once()
+        self.assertEqual(artifacts["title"], "Kitchen Painting Supplies")
+        self.assertEqual(artifacts["short_summary"], "Paint run planned.")
+        self.assertEqual(artifacts["detailed_summary"], "Speaker 0 buys paint.")
+
+    def test_fenced_json(self):
+        artifacts = self._generate(
+            'Here you go:\n```json\n{"title": "Kitchen Painting Supplies", '
+            '"short_summary": "Paint run planned.", "detailed_summary": "Details."}\n```'
+        )
+
+        self.assertEqual(artifacts["title"], "Kitchen Painting Supplies")
+        self.assertEqual(artifacts["detailed_summary"], "Details.")
+
+    def test_multiline_detailed_summary(self):
+        # Models often emit raw newlines inside the detailed summary string
+        artifacts = self._generate(
+            '{"title": "Kitchen Painting Plans", "short_summary": "Paint run planned.", '
+            '"detailed_summary": "Paragraph one.\n\n- bullet a"}'
+        )
+
+        self.assertEqual(artifacts["title"], "Kitchen Painting Plans")
+        self.assertEqual(artifacts["short_summary"], "Paint run planned.")
+        self.assertEqual(artifacts["detailed_summary"], "Paragraph one.\n\n- bullet a")
+
+    def test_recovery_skips_only_undecodable_field(self):
+        # Truncated object whose short summary has an invalid escape
+        artifacts = self._generate(
+            '{"title": "Kitchen Painting Plans", "short_summary": "Paint \\q run", '
+            '"detailed_summary": "Paragraph one.\n\n- bullet a"'
+        )
+
+        self.assertEqual(artifacts["title"], "Kitchen Painting Plans")
+        self.assertEqual(artifacts["detailed_summary"], "Paragraph one.\n\n- bullet a")
+        self.assertNotEqual(artifacts["short_summary"], "Paint \\q run")
+
+    def test_truncated_json_keeps_completed_fields(self):
+        artifacts = self._generate(
+            '{"title": "Kitchen Painting Supplies", "short_summary": "Paint run planned.", '
+            '"detailed_summary": "Speaker 0 is heading to the hardware'
+        )
+
+        self.assertEqual(artifacts["title"], "Kitchen Painting Supplies")
+        self.assertEqual(artifacts["short_summary"], "Paint run planned.")
+        # Only the cut-off field falls back to the cleaned transcript
+        self.assertTrue(artifacts["detailed_summary"].startswith("Speaker 0: I'm going"))
+
+    def test_malformed_json_falls_back_without_speaker_names(self):
+        artifacts = self._generate("{'title': not json at all}")
+
+        self.assertEqual(artifacts["title"], "I'm going to the hardware store")
+        self.assertNotIn("Speaker", artifacts["title"])
+        self.assertTrue(artifacts["short_summary"])
+        self.assertTrue(artifacts["detailed_summary"])
+
+    def test_llm_error_falls_back_without_speaker_names(self):
+        self.mock_generate.side_effect = RuntimeError("LLM unavailable")
+
+        artifacts = asyncio.run(generate_conversation_artifacts(TEXT, segments=SEGMENTS))
+
+        self.assertNotIn("Speaker", artifacts["title"])
+
+    def test_short_transcript_skips_llm(self):
+        # Speaker labels would push this past the word threshold; the check uses plain text
+        segments = [
+            {"speaker": f"Speaker {i % 2}", "text": text, "start": float(i), "end": i + 1.0}
+            for i, text in enumerate(
+                [
+                    "I'm shopping.",
+                    "Remember groceries?",
+                    "Definitely, yes.",
+                    "Don't forget.",
+                    "Understandably, absolutely.",
+                    "Appreciate it.",
+                    "Goodbye, friend.",
+                ]
+            )
+        ]
+        text = " ".join(segment["text"] for segment in segments)
+
+        artifacts = asyncio.run(generate_conversation_artifacts(text, segments=segments))
+
+        self.mock_generate.assert_not_awaited()
+        self.assertEqual(artifacts["title"], "I'm Shopping")
+        self.assertEqual(artifacts["short_summary"], "I'm shopping.")
+        self.assertTrue(artifacts["detailed_summary"].startswith("Speaker 0: I'm shopping."))
+
+
+class TestArtifactsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.generate_patcher = patch.object(
+            conversation_utils, "async_generate", new_callable=AsyncMock
+        )
+        self.mock_generate = self.generate_patcher.start()
+        self.addCleanup(self.generate_patcher.stop)
+
+        self.client_patcher = patch.object(conversation_utils, "get_llm_client")
+        self.client_patcher.start().return_value.get_default_model.return_value = "test-model"
+        self.addCleanup(self.client_patcher.stop)
+
+        self.redis = AsyncMock()
+        self.redis.get.return_value = None
+
+    def _generate(self, response):
+        self.mock_generate.return_value = response
+        return asyncio.run(
+            generate_conversation_artifacts(TEXT, segments=SEGMENTS, redis_client=self.redis)
+        )
+
+    def test_complete_artifacts_are_cached(self):
+        artifacts = self._generate(
+            '{"title": "Kitchen Painting Supplies", "short_summary": "Paint run planned.", '
+            '"detailed_summary": "Speaker 0 buys paint."}'
+        )
+
+        self.redis.set.assert_awaited_once()
+        key, value = self.redis.set.await_args.args
+        self.assertTrue(key.startswith("llm:artifacts:"))
+        self.assertEqual(json.loads(value), artifacts)
+
+    def test_fallback_artifacts_are_not_cached(self):
+        self._generate("{'title': not json at all}")
+        self._generate('{"title": "Kitchen Painting Supplies", "detailed_summary": "Speaker 0')
+
+        self.redis.set.assert_not_awaited()
+
+    def test_cache_hit_skips_llm(self):
+        cached = {"title": "Cached", "short_summary": "Cached.", "detailed_summary": "Cached."}
+        self.redis.get.return_value = json.dumps(cached).encode()
+
+        artifacts = self._generate("unused")
+
+        self.mock_generate.assert_not_awaited()
+        self.assertEqual(artifacts, cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
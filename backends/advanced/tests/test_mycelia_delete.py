@@ -0,0 +1,164 @@
+"""
+Tests for deleting all of a user's memories from Mycelia.
+"""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+import httpx
+import orjson
+
+# Importing the Mycelia provider imports advanced_omi_backend.auth, which requires these
+os.environ.setdefault("AUTH_SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ADMIN_PASSWORD", "test-admin-password")
+
+from advanced_omi_backend.services.memory.config import MemoryConfig
+from advanced_omi_backend.services.memory.providers import mycelia
+from advanced_omi_backend.services.memory.providers.mycelia import (
+    MYCELIA_MONGO_PATH,
+    MYCELIA_OBJECTS_PATH,
+    MyceliaMemoryService,
+)
+
+API_URL = "http://mycelia.test"
+USER_ID = "user-1"
+USER_EMAIL = "user@example.com"
+
+
+class TestMyceliaDeleteAll(unittest.TestCase):
+
+    def setUp(self):
+        self.service = MyceliaMemoryService(MemoryConfig(mycelia_config={"api_url": API_URL}))
+        self.service._initialized = True
+        # Pre-seed the caches so no user lookup or JWT signing happens
+        self.service._email_cache[USER_ID] = USER_EMAIL
+        self.service._jwt_cache[f"{USER_ID}:{USER_EMAIL}"] = "token"
+
+        self.requests = []
+        # Status code and JSON body returned for the bulk deleteMany call
+        self.bulk_response = (404, {"error": "unknown action"})
+        self.objects = [f"{i:04d}" for i in range(5)]
+        self.deleted = []
+        # IDs whose delete is refused, and whether list honours skip
+        self.failing = set()
+        self.honour_skip = True
+
+    async def _handler(self, request):
+        body = orjson.loads(request.content)
+        self.requests.append((request.url.path, body))
+
+        if request.url.path == MYCELIA_MONGO_PATH:
+            status, payload = self.bulk_response
+            return httpx.Response(status, json=payload)
+
+        if body["action"] == "list":
+            options = body["options"]
+            skip = options["skip"] if self.honour_skip else 0
+            page = sorted(self.objects)[skip : skip + options["limit"]]
+            return httpx.Response(200, json=[{"_id": {"$oid": oid}} for oid in page])
+
+        if body["action"] == "delete":
+            if body["id"] in self.failing:
+                return httpx.Response(403, json={"error": "forbidden"})
+            self.objects.remove(body["id"])
+            self.deleted.append(body["id"])
+            return httpx.Response(200, json={"deletedCount": 1})
+
+        return httpx.Response(400, json={"error": "unexpected action"})
+
+    def _delete_all(self):
+        async def run():
+            self.service._client = httpx.AsyncClient(
+                base_url=API_URL, transport=httpx.MockTransport(self._handler)
+            )
+            try:
+                return await self.service.delete_all_user_memories(USER_ID)
+            finally:
+                await self.service._client.aclose()
+
+        return asyncio.run(run())
+
+    def test_bulk_delete_request_body(self):
+        self.bulk_response = (200, {"deletedCount": 5})
+
+        self._delete_all()
+
+        self.assertEqual(
+            self.requests,
+            [
+                (
+                    MYCELIA_MONGO_PATH,
+                    {
+                        "action": "deleteMany",
+                        "collection": "objects",
+                        "query": {"userId": USER_ID},
+                    },
+                )
+            ],
+        )
+
+    def test_bulk_delete_returns_deleted_count(self):
+        self.bulk_response = (200, {"deletedCount": 42})
+
+        self.assertEqual(self._delete_all(), 42)
+        self.assertEqual(self.deleted, [])
+
+    def test_bulk_delete_client_error_falls_back_to_per_object_deletes(self):
+        for status in (400, 403, 404):
+            self.requests = []
+            self.objects = [f"{i:04d}" for i in range(5)]
+            self.deleted = []
+            self.bulk_response = (status, {"error": "not allowed"})
+
+            self.assertEqual(self._delete_all(), 5)
+            self.assertEqual(sorted(self.deleted), [f"{i:04d}" for i in range(5)])
+            self.assertEqual(self.requests[0][0], MYCELIA_MONGO_PATH)
+
+    def test_bulk_delete_boolean_reply_is_not_a_count(self):
+        self.bulk_response = (200, True)
+
+        # Falls back to deleting one by one instead of reporting one deletion
+        self.assertEqual(self._delete_all(), 5)
+        self.assertEqual(len(self.deleted), 5)
+
+
+    def _list_calls(self):
+        return [body for path, body in self.requests if body.get("action") == "list"]
+
+    def test_paged_delete_skips_failures_spread_across_pages(self):
+        self.objects = [f"{i:04d}" for i in range(1203)]
+        self.failing = {"0007", "0750"}
+
+        self.assertEqual(self._delete_all(), 1201)
+        self.assertEqual(sorted(self.objects), ["0007", "0750"])
+        self.assertEqual(len(self._list_calls()), 3)
+
+    def test_paged_delete_stops_when_skip_is_ignored(self):
+        self.honour_skip = False
+        self.objects = [f"{i:04d}" for i in range(12)]
+        # Every memory on the first page refuses to be deleted
+        self.failing = {f"{i:04d}" for i in range(5)}
+
+        with patch.object(mycelia, "DELETE_PAGE_SIZE", 5):
+            deleted = self._delete_all()
+
+        self.assertEqual(deleted, 0)
+        # The second listing returns the same failing page, which ends the loop
+        self.assertEqual(len(self._list_calls()), 2)
+
+    def test_paged_delete_makes_progress_when_skip_is_ignored(self):
+        self.honour_skip = False
+        self.objects = [f"{i:04d}" for i in range(12)]
+        self.failing = {"0001", "0008"}
+
+        with patch.object(mycelia, "DELETE_PAGE_SIZE", 5):
+            deleted = self._delete_all()
+
+        self.assertEqual(deleted, 10)
+        self.assertEqual(sorted(self.objects), ["0001", "0008"])
+
+
+if __name__ == "__main__":
+    unittest.main()
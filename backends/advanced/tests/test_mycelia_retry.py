@@ -0,0 +1,191 @@
+"""
+Tests for Mycelia request retries and the circuit breaker.
+"""
+
+import asyncio
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+# Importing the Mycelia provider imports advanced_omi_backend.auth, which requires these
+os.environ.setdefault("AUTH_SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ADMIN_PASSWORD", "test-admin-password")
+
+from advanced_omi_backend.services.memory.config import MemoryConfig
+from advanced_omi_backend.services.memory.providers import mycelia
+from advanced_omi_backend.services.memory.providers.mycelia import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_OPEN_SECONDS,
+    MYCELIA_OBJECTS_PATH,
+    RETRY_ATTEMPTS,
+    MyceliaCircuitOpenError,
+    MyceliaMemoryService,
+)
+
+API_URL = "http://mycelia.test"
+
+
+class TestMyceliaRetry(unittest.TestCase):
+
+    def setUp(self):
+        self.delay_patcher = patch.object(mycelia, "RETRY_BASE_DELAY_SECONDS", 0)
+        self.delay_patcher.start()
+        self.addCleanup(self.delay_patcher.stop)
+
+        self.service = MyceliaMemoryService(MemoryConfig(mycelia_config={"api_url": API_URL}))
+        self.requests = []
+        # Each entry is a status code or an exception to raise; the last one repeats
+        self.outcomes = [200]
+
+    async def _handler(self, request):
+        self.requests.append(request)
+        outcome = self.outcomes[min(len(self.requests), len(self.outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={})
+
+    def _run(self, coro_fn):
+        async def run():
+            self.service._client = httpx.AsyncClient(
+                base_url=API_URL, transport=httpx.MockTransport(self._handler)
+            )
+            try:
+                return await coro_fn()
+            finally:
+                await self.service._client.aclose()
+
+        return asyncio.run(run())
+
+    def _post(self, idempotent=True):
+        return self.service._post(MYCELIA_OBJECTS_PATH, b"{}", "token", idempotent)
+
+    def test_idempotent_request_retried_on_bad_gateway(self):
+        self.outcomes = [502, 200]
+
+        response = self._run(self._post)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_idempotent_request_retried_on_read_timeout(self):
+        self.outcomes = [httpx.ReadTimeout("timed out"), 200]
+
+        response = self._run(self._post)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_non_idempotent_request_not_retried_after_send(self):
+        for outcome in (httpx.ReadTimeout("timed out"), httpx.RemoteProtocolError("eof")):
+            self.requests = []
+            self.outcomes = [outcome, 200]
+
+            with self.assertRaises(httpx.TransportError):
+                self._run(lambda: self._post(idempotent=False))
+            self.assertEqual(len(self.requests), 1)
+
+        for status in (502, 504):
+            self.requests = []
+            self.outcomes = [status, 200]
+
+            response = self._run(lambda: self._post(idempotent=False))
+            self.assertEqual(response.status_code, status)
+            self.assertEqual(len(self.requests), 1)
+
+    def test_non_idempotent_request_retried_when_unsent_or_unavailable(self):
+        for outcome in (httpx.ConnectError("refused"), httpx.PoolTimeout("pool"), 503):
+            self.requests = []
+            self.outcomes = [outcome, 200]
+
+            response = self._run(lambda: self._post(idempotent=False))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(self.requests), 2)
+
+    def test_create_action_is_sent_as_non_idempotent(self):
+        self.outcomes = [httpx.ReadTimeout("timed out"), 200]
+
+        with self.assertRaises(RuntimeError):
+            self._run(lambda: self.service._call_resource("create", "token", object={}))
+        self.assertEqual(len(self.requests), 1)
+
+    def test_breaker_opens_after_threshold(self):
+        self.outcomes = [503]
+
+        async def call_until_open():
+            for _ in range(BREAKER_FAILURE_THRESHOLD + 1):
+                await self._post()
+            with self.assertRaisesRegex(RuntimeError, "circuit breaker is open"):
+                await self._post()
+
+        self._run(call_until_open)
+        self.assertEqual(len(self.requests), (BREAKER_FAILURE_THRESHOLD + 1) * RETRY_ATTEMPTS)
+
+    def test_internal_server_errors_trip_breaker_without_retries(self):
+        self.outcomes = [500]
+
+        async def call_until_open():
+            for _ in range(BREAKER_FAILURE_THRESHOLD + 1):
+                await self._post()
+            with self.assertRaises(MyceliaCircuitOpenError):
+                await self._post()
+
+        self._run(call_until_open)
+        # 500 is not retried, but it still counts as a breaker failure
+        self.assertEqual(len(self.requests), BREAKER_FAILURE_THRESHOLD + 1)
+
+    def test_failed_500_probe_keeps_breaker_open(self):
+        self.service._breaker_opened_at = time.monotonic() - BREAKER_OPEN_SECONDS - 1
+        self.outcomes = [500]
+
+        self.assertEqual(self._run(self._post).status_code, 500)
+        self.assertNotEqual(self.service._breaker_opened_at, 0.0)
+        with self.assertRaises(MyceliaCircuitOpenError):
+            self._run(self._post)
+
+    def test_open_breaker_logs_warning_without_traceback(self):
+        self.service._breaker_opened_at = time.monotonic()
+
+        with self.assertLogs("memory_service", level="WARNING") as logs:
+            with self.assertRaises(MyceliaCircuitOpenError):
+                self._run(lambda: self.service._call_resource("list", "token"))
+
+        self.assertEqual(len(self.requests), 0)
+        self.assertEqual([record.levelname for record in logs.records], ["WARNING"])
+        self.assertIsNone(logs.records[0].exc_info)
+
+    def test_half_open_lets_single_probe_through(self):
+        self.service._breaker_opened_at = time.monotonic() - BREAKER_OPEN_SECONDS - 1
+        self.outcomes = [503]
+
+        async def concurrent_calls():
+            return await asyncio.gather(self._post(), self._post(), return_exceptions=True)
+
+        results = self._run(concurrent_calls)
+
+        # One probe, sent once without retries; the other call fails fast
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(results[0].status_code, 503)
+        self.assertIsInstance(results[1], RuntimeError)
+
+        # The failed probe reopened the breaker for a full period
+        with self.assertRaisesRegex(RuntimeError, "circuit breaker is open"):
+            self._run(self._post)
+        self.assertEqual(len(self.requests), 1)
+
+    def test_successful_probe_closes_breaker(self):
+        self.service._breaker_opened_at = time.monotonic() - BREAKER_OPEN_SECONDS - 1
+        self.service._breaker_failures = BREAKER_FAILURE_THRESHOLD + 1
+
+        response = self._run(self._post)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.service._breaker_opened_at, 0.0)
+        self.assertEqual(self.service._breaker_failures, 0)
+        self.assertEqual(self._run(self._post).status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,7 @@ from dotenv import load_dotenv
 # 3. .env (default configuration)
 
 # Find repository root (tests/setup/test_env.py -> go up 2 levels)
-REPO_ROOT = Path(__file__).parent.parent.parent
+REPO_ROOT = Path(__file__).resolve().parents[2]
 backend_dir = REPO_ROOT / "backends" / "advanced"
 
 # Export absolute paths for Robot Framework keywords
@@ -17,12 +17,17 @@ BACKEND_DIR = str(backend_dir.absolute())
 REPO_ROOT_DIR = str(REPO_ROOT.absolute())
 SPEAKER_RECOGNITION_DIR = str((REPO_ROOT / "extras" / "speaker-recognition").absolute())
 
-# Load in reverse order of precedence (since override=False won't overwrite existing vars)
-# Load .env.test first (will set test-specific values)
-load_dotenv(backend_dir / ".env.test", override=False)
+# Load in reverse order of precedence (since override=False won't overwrite existing vars).
+# Skip if already done in this process or a parent: the loaded values are inherited
+# through the environment, so re-reading the files on every import changes nothing.
+if not os.environ.get("_TEST_ENV_LOADED"):
+    # Load .env.test first (will set test-specific values)
+    load_dotenv(backend_dir / ".env.test", override=False)
 
-# Load .env second (will only fill in missing values, won't override .env.test or existing env vars)
-load_dotenv(backend_dir / ".env", override=False)
+    # Load .env second (will only fill in missing values, won't override .env.test or existing env vars)
+    load_dotenv(backend_dir / ".env", override=False)
+
+    os.environ["_TEST_ENV_LOADED"] = "1"
 
 # Final precedence: environment variables > .env.test > .env
 